@@ -3,9 +3,10 @@
 The main KuzuGraphWidget class is defined in this module.
 
 """
-from typing import Any, Callable, Dict, Union, Optional, List, Tuple
+from typing import Any, Callable, Dict, Final, FrozenSet, Union, Optional, List, Set, Tuple
 import inspect
-from datetime import date, datetime
+import os
+import sys
 import warnings
 import logging
 
@@ -16,8 +17,112 @@ from yfiles_jupyter_graphs import GraphWidget
 POSSIBLE_NODE_BINDINGS = {'coordinate', 'color', 'size', 'type', 'styles', 'scale_factor', 'position',
                           'layout', 'property', 'label'}
 POSSIBLE_EDGE_BINDINGS = {'color', 'thickness_factor', 'styles', 'property', 'label'}
+# (binding key, default mapping attribute, mapping attribute) of the GraphWidget for each binding
+_NODE_BINDING_ATTRIBUTES = tuple((key, f"default_node_{key}_mapping", f"_node_{key}_mapping")
+                                 for key in sorted(POSSIBLE_NODE_BINDINGS))
+_EDGE_BINDING_ATTRIBUTES = tuple((key, f"default_edge_{key}_mapping", f"_edge_{key}_mapping")
+                                 for key in sorted(POSSIBLE_EDGE_BINDINGS))
 COLOR_PALETTE = ['#2196F3', '#4CAF50', '#F44336', '#607D8B', '#673AB7', '#CDDC39', '#9E9E9E', '#9C27B0']
 KUZU_LABEL_KEYS = ['name', 'title', 'text', 'description', 'caption', 'label']
+# priority of the KUZU_LABEL_KEYS, lower values are preferred
+_LABEL_KEY_PRIORITIES = {key: priority for priority, key in enumerate(KUZU_LABEL_KEYS)}
+
+_MSG_GET_CONNECTION: Final = "get_connection() is deprecated. Use the 'connection' property instead."
+_MSG_SET_CONNECTION: Final = "set_connection() is deprecated. Use the 'connection' property instead."
+_MSG_GET_NCM: Final = "get_node_cell_mapping() is deprecated. Use the 'node_cell_mapping' property instead."
+_MSG_SET_NCM: Final = "set_node_cell_mapping() is deprecated. Use the 'node_cell_mapping' property instead."
+_MSG_DEL_NCM: Final = "del_node_cell_mapping() is deprecated. Use the 'node_cell_mapping' property instead."
+
+# emit deprecation warnings without resolving the calling frame, i.e. they are attributed to this module
+_DISABLE_WARN_STACKLEVEL: Final = os.environ.get("YFILES_KUZU_DISABLE_WARN_STACKLEVEL", "").lower() in ("1", "true")
+
+# the messages of the deprecation warnings that were already emitted with a "once" filter action, which shows each
+# message only once regardless of the location. Cleared whenever warnings.filters changes.
+_WARNED: Set[str] = set()
+
+# the warnings.filters for which _DEPRECATIONS_ENABLED was determined
+_DEPRECATION_FILTERS: Optional[List[Any]] = None
+_DEPRECATIONS_ENABLED = True
+
+
+def _deprecations_enabled() -> bool:
+    """
+    Whether a DeprecationWarning may be shown with the current warnings filters.
+
+    The result is cached until warnings.filters changes. It is only False if DeprecationWarnings are ignored
+    unconditionally, e.g. by warnings.simplefilter("ignore").
+    """
+    global _DEPRECATION_FILTERS, _DEPRECATIONS_ENABLED
+    filters = warnings.filters
+    if filters != _DEPRECATION_FILTERS:
+        # the default action applies if no filter matches
+        _DEPRECATIONS_ENABLED = warnings.defaultaction != 'ignore'
+        for action, message, category, module, lineno in filters:
+            if not issubclass(DeprecationWarning, category):
+                continue
+            if action != 'ignore':
+                _DEPRECATIONS_ENABLED = True
+                break
+            if message is None and module is None and not lineno:
+                # ignores all DeprecationWarnings, the following filters are shadowed
+                _DEPRECATIONS_ENABLED = False
+                break
+        _DEPRECATION_FILTERS = list(filters)
+        _WARNED.clear()
+    return _DEPRECATIONS_ENABLED
+
+
+def _filter_matches(pattern: Any, value: str) -> bool:
+    # like the warnings module: the default filters use plain strings, filterwarnings() compiled regular expressions
+    if pattern is None:
+        return True
+    if isinstance(pattern, str):
+        return pattern == value
+    return bool(pattern.match(value))
+
+
+def _deprecation_filter_action(message: str, module: str, lineno: int) -> str:
+    """
+    The action of the first warnings filter that matches a DeprecationWarning with the given message and location.
+    """
+    for action, message_pattern, category, module_pattern, filter_lineno in warnings.filters:
+        if (_filter_matches(message_pattern, message)
+                and issubclass(DeprecationWarning, category)
+                and _filter_matches(module_pattern, module)
+                and (not filter_lineno or filter_lineno == lineno)):
+            return action
+    return warnings.defaultaction
+
+
+def _warn_deprecated(message: str) -> None:
+    """
+    Emits a DeprecationWarning with the given message for the caller of the deprecated method calling this function.
+
+    If the matching filter action is "once", the message is skipped without consulting the warnings module until
+    the warnings filters change. The other actions are left to the warnings module, e.g. "default" shows the message
+    once per calling location.
+    """
+    if not _deprecations_enabled() or message in _WARNED:
+        return
+    if _DISABLE_WARN_STACKLEVEL:
+        # attribute the warning to this function, like warnings.warn(message, DeprecationWarning)
+        frame = sys._getframe()
+    else:
+        # equivalent to warnings.warn(message, DeprecationWarning, stacklevel=3) without walking the stack in Python
+        try:
+            frame = sys._getframe(2)
+        except ValueError:
+            # there is no Python caller frame, let warnings.warn() handle that
+            warnings.warn(message, DeprecationWarning, stacklevel=3)
+            return
+    module_globals = frame.f_globals
+    module = module_globals.get('__name__', '<string>')
+    warnings.warn_explicit(message, DeprecationWarning, frame.f_code.co_filename, frame.f_lineno,
+                           module=module, registry=module_globals.setdefault('__warningregistry__', {}))
+    # only record the message once it was emitted
+    if _deprecation_filter_action(message, module, frame.f_lineno) == 'once':
+        _WARNED.add(message)
+
 
 class KuzuGraphWidget:
     """
@@ -71,6 +176,10 @@ class KuzuGraphWidget:
         self._edge_configurations = {}
         self._parent_configurations = set()
 
+        # the binding resolvers of the configurations, keyed by (binding key, configurations id),
+        # cleared whenever the node or relationship configurations change
+        self._mapping_cache: Dict[Tuple[str, int], Dict[str, Optional[Callable[[Dict], Any]]]] = {}
+
         # a mapping of node/edge types to a color, e.g. item types are automatically mapped to
         # different colors
         self._itemtype2colorIdx = {}
@@ -85,11 +194,7 @@ class KuzuGraphWidget:
         Returns:
             None
         """
-        warnings.warn(
-            "set_connection() is deprecated. Use the 'connection' property instead.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        _warn_deprecated(_MSG_SET_CONNECTION)
         self.connection = connection
 
     def get_connection(self) -> Any:
@@ -99,11 +204,7 @@ class KuzuGraphWidget:
         Returns:
             kuzu connection
         """
-        warnings.warn(
-            "get_connection() is deprecated. Use the 'connection' property instead.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        _warn_deprecated(_MSG_GET_CONNECTION)
         return self.connection
 
     @property
@@ -144,34 +245,39 @@ class KuzuGraphWidget:
         Returns:
             Tuple containing (nodes, relationships) as lists of dictionaries
         """
+        # the table info of each node/relationship table, keyed by table label. It is only kept for this result,
+        # so that schema changes of the database in between queries are picked up.
+        table_infos: Dict[str, Tuple[Optional[str], FrozenSet[str], FrozenSet[str]]] = {}
+
         # Helper functions
-        def encode_node_id(node: dict[str, Any], table_primary_key_dict: dict[str, Any]) -> str:
+        def get_table_info(label: str) -> Tuple[Optional[str], FrozenSet[str], FrozenSet[str]]:
+            if label not in table_infos:
+                table_infos[label] = self._get_table_info(label)
+            return table_infos[label]
+
+        def encode_node_id(node: dict[str, Any]) -> str:
             node_label = self._get_case_insensitive(node, "_label")
-            return f"{node_label}_{node[table_primary_key_dict[node_label]]!s}"
+            primary_key, _, _ = get_table_info(node_label)
+            return f"{node_label}_{node[primary_key]!s}"
 
         def encode_rel_id(rel: dict[str, Any]) -> tuple[int, int]:
             _id = self._get_case_insensitive(rel, "_id")
             return _id["table"], _id["offset"]
 
         def clean_value(v: Any) -> Any:
-            if isinstance(v, (date, datetime)):
-                return v.isoformat()
-            return v
+            # date and timestamp values are not JSON serializable
+            return None if v is None else v.isoformat()
 
         if self._connection is None:
             raise ValueError("No database connection provided. Initialize widget with a valid Kuzu connection.")
 
-        result = []
-        while query_result.has_next():  # type: ignore
-            result.append(query_result.get_next())  # type: ignore
-
         node_map = {}
         relationship_map = {}
         table_to_label_dict = {}
-        table_primary_key_dict = {}
 
-        # Process each row in the result
-        for row in result:
+        # Process each row in the result while consuming it
+        while query_result.has_next():  # type: ignore
+            row = query_result.get_next()  # type: ignore
             # Each row is a list with values for s,r,t in order
             for value in row:
                 # Skip empty values
@@ -191,8 +297,6 @@ class KuzuGraphWidget:
 
                 # Process relationships
                 elif _label and _src and _dst:
-                    # Remove None values from the relationship
-                    self._remove_none_values(value)
                     relationship_map[encode_rel_id(value)] = value
 
                 # Process recursive relationships and their associated nodes
@@ -203,37 +307,25 @@ class KuzuGraphWidget:
 
                     recursive_rels = _rels
                     for rel in recursive_rels:
-                        # Remove None values from the relationship
-                        self._remove_none_values(rel)
                         relationship_map[encode_rel_id(rel)] = rel
 
         # Convert nodes to the result format
         result_nodes = []
-        for node in node_map.values():
+        # the encoded node ids keyed by (table, offset), relationships reference their nodes by this key
+        node_id_by_key = {}
+        for node_key, node in node_map.items():
             node_label = self._get_case_insensitive(node, "_label")
-            # Get primary key for each node label using table info
-            node_tbl_info = self._connection.execute(f"CALL TABLE_INFO('{node_label}') RETURN *")
-            node_tbl_properties = []
-            while node_tbl_info.has_next():  # type: ignore
-                prop = node_tbl_info.get_next()  # type: ignore
-                if prop[-1] is True:
-                    # Kuzu enforces that every node table MUST have one and only one primary key, so
-                    # this `if` condition is guaranteed to be hit in all scenarios
-                    table_primary_key_dict[node_label] = prop[1]
-                    node_tbl_properties.append(prop[1])
-                    break
+            _, node_tbl_properties, node_tbl_temporal_properties = get_table_info(node_label)
 
             # Store the node results
-            node_id = encode_node_id(node, table_primary_key_dict)
-            while node_tbl_info.has_next():  # type: ignore
-                prop = node_tbl_info.get_next()  # type: ignore
-                # Add all the remaining properties to the node table list
-                node_tbl_properties.append(prop[1])
+            node_id = encode_node_id(node)
+            node_id_by_key[node_key] = node_id
             result_nodes.append({
                 "id": node_id,
                 "properties": {
                     "label": node_label,
-                    **{k: clean_value(v) for k, v in node.items() if not k.startswith('_') and k in node_tbl_properties}
+                    **{k: clean_value(v) if k in node_tbl_temporal_properties else v
+                       for k, v in node.items() if not k.startswith('_') and k in node_tbl_properties}
                 }
             })
 
@@ -242,21 +334,15 @@ class KuzuGraphWidget:
         for rel in relationship_map.values():
             _src = self._get_case_insensitive(rel, "_src")
             _dst = self._get_case_insensitive(rel, "_dst")
-            src_node = node_map[(_src["table"], _src["offset"])]
-            dst_node = node_map[(_dst["table"], _dst["offset"])]
-            src_id = encode_node_id(src_node, table_primary_key_dict)
-            dst_id = encode_node_id(dst_node, table_primary_key_dict)
+            src_id = node_id_by_key[(_src["table"], _src["offset"])]
+            dst_id = node_id_by_key[(_dst["table"], _dst["offset"])]
 
             rel_label = self._get_case_insensitive(rel, "_label")
-            rel_tbl_info = self._connection.execute(f"CALL TABLE_INFO('{rel_label}') RETURN *")
-            rel_tbl_properties = []
-            while rel_tbl_info.has_next():  # type: ignore
-                prop = rel_tbl_info.get_next()  # type: ignore
-                rel_tbl_properties.append(prop[1])
+            _, rel_tbl_properties, rel_tbl_temporal_properties = get_table_info(rel_label)
 
             _, offset = encode_rel_id(rel)   # The first value is the table id & isn't needed
-            src_label = self._get_case_insensitive(src_node, "_label")
-            dst_label = self._get_case_insensitive(dst_node, "_label")
+            src_label = table_to_label_dict[_src["table"]]
+            dst_label = table_to_label_dict[_dst["table"]]
             rel_id = f"{src_label}_{dst_label}_{offset}"
             result_relationships.append({
                 "id": rel_id,
@@ -264,12 +350,53 @@ class KuzuGraphWidget:
                 "end": dst_id,
                 "properties": {
                     "label": rel_label,
-                    **{k: clean_value(v) for k, v in rel.items() if not k.startswith('_') and k in rel_tbl_properties}
+                    **{k: clean_value(v) if k in rel_tbl_temporal_properties else v
+                       for k, v in rel.items() if v is not None and not k.startswith('_') and k in rel_tbl_properties}
                 }
             })
 
         return result_nodes, result_relationships
 
+    def _get_table_info(self, label: str) -> Tuple[Optional[str], FrozenSet[str], FrozenSet[str]]:
+        """
+        Get the primary key, the property names and the date/timestamp property names of the given node or
+        relationship table.
+
+        Args:
+            label: The node label or relationship type of the table
+
+        Returns:
+            Tuple containing (primary key, property names, temporal property names). The primary key is None for
+            relationship tables.
+        """
+        tbl_info = self._connection.execute(f"CALL TABLE_INFO('{label}') RETURN *")
+        # materialize the rows once, the primary key may be listed after other properties
+        rows = self._drain(tbl_info)
+        # Kuzu enforces that every node table MUST have one and only one primary key,
+        # relationship tables have none
+        primary_key = next((row[1] for row in rows if row[-1] is True), None)
+        # DATE and TIMESTAMP* columns, list types like DATE[] are excluded
+        temporal_properties = frozenset(row[1] for row in rows
+                                        if str(row[2]).startswith(('DATE', 'TIMESTAMP'))
+                                        and not str(row[2]).endswith(']'))
+        return primary_key, frozenset(row[1] for row in rows), temporal_properties
+
+    @staticmethod
+    def _drain(query_result: Any) -> List[Any]:
+        """
+        Get all remaining rows of a small Kuzu query result, e.g. of TABLE_INFO.
+
+        Args:
+            query_result: QueryResult from Kuzu
+
+        Returns:
+            The remaining rows as list
+        """
+        rows = []
+        while query_result.has_next():  # type: ignore
+            rows.append(query_result.get_next())  # type: ignore
+        return rows
+
     def _get_case_insensitive(self, dictionary: Dict[str, Any], key: str) -> Any:
         """
         Get a value from a dictionary case-insensitively.
@@ -298,17 +425,6 @@ class KuzuGraphWidget:
         node_map[(_id["table"], _id["offset"])] = node
         table_to_label_dict[_id["table"]] = self._get_case_insensitive(node, "_label")
         
-    def _remove_none_values(self, dictionary: Dict[str, Any]) -> None:
-        """
-        Remove a `None` key's values from a dict.
-        
-        Args:
-            dict: The dict whose None keys need cleaning
-        """
-        for key in list(dictionary.keys()):
-            if dictionary[key] is None:
-                del dictionary[key]
-
     def _default_color_mapping(self, element: Dict):
         itemtype = element['properties']['label']
         if itemtype not in self._itemtype2colorIdx:
@@ -364,7 +480,7 @@ class KuzuGraphWidget:
             self.__create_group_nodes(self._node_configurations, widget)
             self.__apply_node_mappings(widget)
             self.__apply_edge_mappings(widget)
-            self.__apply_heat_mapping({**self._node_configurations, **self._edge_configurations}, widget)
+            self.__apply_heat_mapping(widget)
             self.__apply_parent_mapping(widget)
             if layout is None:
                 widget.set_graph_layout(self._graph_layout)
@@ -380,19 +496,69 @@ class KuzuGraphWidget:
 
     @staticmethod
     def __get_item_text(element: Dict) -> Union[str, None]:
-        lowercase_element_props = {key.lower(): value for key, value in element.get('properties', {}).items()}
-        for key in KUZU_LABEL_KEYS:
-            if key in lowercase_element_props:
-                return str(lowercase_element_props[key])
-        return None
+        properties = element.get('properties', {})
+        text_priority = None
+        text = None
+        # fast path: kuzu property keys are typically lowercase already
+        for priority, key in enumerate(KUZU_LABEL_KEYS):
+            value = properties.get(key)
+            if value is not None:
+                if priority == 0:
+                    return str(value)
+                text_priority, text = priority, value
+                break
+
+        # a differently cased label key may still have a higher priority
+        for key, value in properties.items():
+            priority = _LABEL_KEY_PRIORITIES.get(key.lower())
+            if (priority is not None and value is not None
+                    and (text_priority is None or priority < text_priority)):
+                text_priority, text = priority, value
+        return None if text_priority is None else str(text)
 
     @staticmethod
-    def __configuration_mapper_factory(binding_key: str, configurations: Dict[str, Dict[str, str]],
+    def __configuration_mapper_factory(binding_key: str, handlers: Dict[str, Optional[Callable[[Dict], Any]]],
                                        default_mapping: Callable) -> Callable[[int, Dict], Union[Dict, str]]:
         """
         This is called once for each POSSIBLE_NODE_BINDINGS or POSSIBLE_EDGE_BINDINGS (as `binding_key` argument) and
         sets the returned mapping function for the `binding_key` on the core yFiles Graphs for Jupyter widget.
 
+        Args:
+            binding_key (str): One of POSSIBLE_NODE_BINDINGS or POSSIBLE_EDGE_BINDINGS
+            handlers (Dict): The resolvers of the configured `binding_key` keyed by the node label or relationship type,
+                as created by __configuration_handlers().
+            default_mapping (MethodType): A reference to the default binding of the yFiles Graphs for Jupyter core widget that should be used when the binding_key is not specified otherwise.
+
+        Returns:
+            FunctionType: A mapping function that can used in the yFiles Graphs for Jupyter core widget.
+        """
+
+        if binding_key == "label":
+            fallback_mapping = KuzuGraphWidget.__indexed_mapping(KuzuGraphWidget.__get_item_text)
+        else:
+            fallback_mapping = KuzuGraphWidget.__indexed_mapping(default_mapping)
+
+        # most bindings are not configured for any label
+        if all(handler is None for handler in handlers.values()):
+            return fallback_mapping
+
+        wildcard_handler = handlers.get('*')
+
+        def mapping(index: int, item: Dict) -> Union[Dict, str]:
+            label = item["properties"]["label"]  # yjg stores the kuzu node/relationship type in properties["label"]
+            handler = handlers.get(label, wildcard_handler)
+            if handler is not None:
+                return handler(item)
+            return fallback_mapping(index, item)
+
+        return mapping
+
+    def __configuration_handlers(self, binding_key: str,
+                                 configurations: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[Callable[[Dict], Any]]]:
+        """
+        Resolves the configured `binding_key` of each node label or relationship type to a function that evaluates the
+        binding for an item. The result is cached until the node or relationship configurations are changed.
+
         Args:
             binding_key (str): One of POSSIBLE_NODE_BINDINGS or POSSIBLE_EDGE_BINDINGS
             configurations (Dict): All configured node or relationship configurations by the user, keyed by the node label or relationship type.
@@ -402,57 +568,77 @@ class KuzuGraphWidget:
                   "Person": { "color": "blue", ... },
                   "*": { "color": "gray", ... }
                 }
-            default_mapping (MethodType): A reference to the default binding of the yFiles Graphs for Jupyter core widget that should be used when the binding_key is not specified otherwise.
 
         Returns:
-            FunctionType: A mapping function that can used in the yFiles Graphs for Jupyter core widget.
+            Dict: The binding resolvers keyed by node label or relationship type. The value is None if the configuration
+                of the label does not specify the `binding_key`.
+        """
+        cache_key = (binding_key, id(configurations))
+        if cache_key not in self._mapping_cache:
+            self._mapping_cache[cache_key] = {
+                label: (KuzuGraphWidget.__binding_resolver(binding_key, type_configuration[binding_key])
+                        if binding_key in type_configuration else None)
+                for label, type_configuration in configurations.items()
+            }
+        return self._mapping_cache[cache_key]
+
+    @staticmethod
+    def __indexed_mapping(mapping: Callable) -> Callable[[int, Dict], Any]:
         """
+        Wraps the given mapping function such that it can be called with (index, item) arguments.
 
-        def mapping(index: int, item: Dict) -> Union[Dict, str]:
-            label = item["properties"]["label"]  # yjg stores the kuzu node/relationship type in properties["label"]
-            if ((label in configurations or '*' in configurations)
-                    and binding_key in configurations.get(label, configurations.get('*'))):
-                type_configuration = configurations.get(label, configurations.get('*'))
-                if binding_key == 'parent_configuration':
-                    # the binding may be a lambda that must be resolved first
-                    binding = type_configuration.get(binding_key)
-                    if callable(binding):
-                        binding = binding(item)
-                    # parent_configuration binding may either resolve to a dict or a string
-                    if isinstance(binding, dict):
-                        group_label = binding.get('text', '')
-                    else:
-                        group_label = binding
-                    result = 'GroupNode' + group_label
-                # mapping
-                elif callable(type_configuration[binding_key]):
-                    result = type_configuration[binding_key](item)
-                # property name
-                elif (not isinstance(type_configuration[binding_key], dict) and
-                      type_configuration[binding_key] in item["properties"]):
-                    result = item["properties"][type_configuration.get(binding_key)]
-                # constant value
-                else:
-                    result = type_configuration.get(binding_key)
+        Some default mappings of the yFiles Graphs for Jupyter core widget do not support "index" as first parameter.
 
-                return result
+        Args:
+            mapping (FunctionType): A mapping function that takes either (index, item) or only (item) as arguments.
 
-            if binding_key == "label":
-                return KuzuGraphWidget.__get_item_text(item)
-            else:
-                # call default mapping
-                # some default mappings do not support "index" as first parameter
-                parameters = inspect.signature(default_mapping).parameters
-                if len(parameters) > 1 and parameters[list(parameters)[0]].annotation == int:
-                    return default_mapping(index, item)
-                else:
-                    return default_mapping(item)
+        Returns:
+            FunctionType: A mapping function that takes (index, item) as arguments.
+        """
+        parameters = inspect.signature(mapping).parameters
+        first_parameter = next(iter(parameters.values()), None)
+        if len(parameters) > 1 and first_parameter is not None and first_parameter.annotation == int:
+            return mapping
 
-        return mapping
+        def indexed_mapping(index: int, item: Dict) -> Any:
+            return mapping(item)
+        return indexed_mapping
+
+    @staticmethod
+    def __binding_resolver(binding_key: str, binding: Any) -> Callable[[Dict], Any]:
+        """
+        Creates a function that resolves the given configured `binding` for an item.
 
-    def __apply_heat_mapping(self, configuration, widget: GraphWidget) -> None:
+        Args:
+            binding_key (str): One of POSSIBLE_NODE_BINDINGS or POSSIBLE_EDGE_BINDINGS, or 'parent_configuration'
+            binding (Any): The configured binding, i.e. a mapping function, a property name or a constant value.
+
+        Returns:
+            FunctionType: A function that resolves the binding for a given node or relationship.
+        """
+        if binding_key == 'parent_configuration':
+            def resolve_parent(item: Dict) -> str:
+                # the binding may be a lambda that must be resolved first
+                group = binding(item) if callable(binding) else binding
+                # parent_configuration binding may either resolve to a dict or a string
+                group_label = group.get('text', '') if isinstance(group, dict) else group
+                return 'GroupNode' + group_label
+            return resolve_parent
+        # mapping
+        if callable(binding):
+            return binding
+        # constant value
+        if isinstance(binding, dict):
+            return lambda item: binding
+        # property name, falls back to a constant value if the item has no such property
+        return lambda item: item["properties"][binding] if binding in item["properties"] else binding
+
+    def __apply_heat_mapping(self, widget: GraphWidget) -> None:
+        # relationship configurations take precedence over node configurations of the same name
+        handlers = {**self.__configuration_handlers('heat', self._node_configurations),
+                    **self.__configuration_handlers('heat', self._edge_configurations)}
         setattr(widget, "_heat_mapping",
-                KuzuGraphWidget.__configuration_mapper_factory('heat', configuration,
+                KuzuGraphWidget.__configuration_mapper_factory('heat', handlers,
                                                                 getattr(widget, 'default_heat_mapping')))
 
     def __create_group_nodes(self, configurations, widget: GraphWidget) -> None:
@@ -480,47 +666,56 @@ class KuzuGraphWidget:
                     configuration = {k: v for k, v in group_node.items() if k != 'text'}
                     self.add_node_configuration(text, **configuration)
 
-        for group_label in group_node_properties.union(group_node_values):
-            node = {'id': 'GroupNode' + group_label, 'properties': {'label': group_label}}
-            widget.nodes = [*widget.nodes, node]
+        group_nodes = [{'id': 'GroupNode' + group_label, 'properties': {'label': group_label}}
+                       for group_label in group_node_properties.union(group_node_values)]
+        # assign once to trigger a single model sync with the frontend
+        if group_nodes:
+            widget.nodes = [*widget.nodes, *group_nodes]
 
     def __apply_parent_mapping(self, widget: GraphWidget) -> None:
+        # maps the parent relationship types to whether they are reversed
+        parent_lookup: Dict[str, bool] = {rel_type: bool(reverse) for rel_type, reverse in self._parent_configurations}
         node_to_parent = {}
-        edge_ids_to_remove = set()
-        for edge in widget.edges[:]:
-            rel_type = edge["properties"]["label"]
-            for (parent_type, is_reversed) in self._parent_configurations:
-                if rel_type == parent_type:
-                    start = edge['start']  # child node id
-                    end = edge['end']  # parent node id
-                    if is_reversed:
-                        node_to_parent[end] = start
-                    else:
-                        node_to_parent[start] = end
-                    edge_ids_to_remove.add(edge['id'])
-                    break
+        # the edges that are not visualized as parent-child relation
+        kept_edges = []
+        for edge in widget.edges:
+            is_reversed = parent_lookup.get(edge["properties"]["label"])
+            if is_reversed is None:
+                kept_edges.append(edge)
+                continue
+            start = edge['start']  # child node id
+            end = edge['end']  # parent node id
+            if is_reversed:
+                node_to_parent[end] = start
+            else:
+                node_to_parent[start] = end
 
-        # use list comprehension to filter out the edges to automatically trigger model sync with the frontend
-        widget.edges = [edge for edge in widget.edges if edge['id'] not in edge_ids_to_remove]
-        current_parent_mapping = getattr(widget, '_node_parent_mapping')
+        # assign a new list to automatically trigger model sync with the frontend
+        if len(kept_edges) != len(widget.edges):
+            widget.edges = kept_edges
+        current_parent_mapping = KuzuGraphWidget.__indexed_mapping(getattr(widget, '_node_parent_mapping'))
+        # only resolve the configured parent mapping for nodes without parent relationship
         setattr(widget, "_node_parent_mapping",
-                lambda index, node: node_to_parent.get(node['id'], current_parent_mapping(index, node)))
+                lambda index, node: node_to_parent.get(node['id']) or current_parent_mapping(index, node))
 
     def __apply_node_mappings(self, widget: GraphWidget) -> None:
-        for key in POSSIBLE_NODE_BINDINGS:
-            default_mapping = self._default_color_mapping if key == "color" else getattr(widget, f"default_node_{key}_mapping")
-            setattr(widget, f"_node_{key}_mapping",
-                    KuzuGraphWidget.__configuration_mapper_factory(key, self._node_configurations, default_mapping))
+        for key, default_mapping_attribute, mapping_attribute in _NODE_BINDING_ATTRIBUTES:
+            default_mapping = self._default_color_mapping if key == "color" else getattr(widget, default_mapping_attribute)
+            setattr(widget, mapping_attribute,
+                    KuzuGraphWidget.__configuration_mapper_factory(
+                        key, self.__configuration_handlers(key, self._node_configurations), default_mapping))
         # manually set parent configuration
         setattr(widget, f"_node_parent_mapping",
-                KuzuGraphWidget.__configuration_mapper_factory('parent_configuration',
-                                                                self._node_configurations, lambda node: None))
+                KuzuGraphWidget.__configuration_mapper_factory(
+                    'parent_configuration', self.__configuration_handlers('parent_configuration', self._node_configurations),
+                    lambda node: None))
 
     def __apply_edge_mappings(self, widget: GraphWidget) -> None:
-        for key in POSSIBLE_EDGE_BINDINGS:
-            default_mapping = self._default_color_mapping if key == "color" else getattr(widget, f"default_edge_{key}_mapping")
-            setattr(widget, f"_edge_{key}_mapping",
-                    KuzuGraphWidget.__configuration_mapper_factory(key, self._edge_configurations, default_mapping))
+        for key, default_mapping_attribute, mapping_attribute in _EDGE_BINDING_ATTRIBUTES:
+            default_mapping = self._default_color_mapping if key == "color" else getattr(widget, default_mapping_attribute)
+            setattr(widget, mapping_attribute,
+                    KuzuGraphWidget.__configuration_mapper_factory(
+                        key, self.__configuration_handlers(key, self._edge_configurations), default_mapping))
 
     def add_node_configuration(self, label: Union[str, list[str]], **kwargs: Dict[str, Any]) -> None:
         """
@@ -548,12 +743,15 @@ class KuzuGraphWidget:
         if text_binding is not None:
             config["label"] = text_binding
 
-        cloned_config = {key: value for key, value in config.items()}
-        if isinstance(label, list):
-            for l in label:
-                self._node_configurations[l] = cloned_config
-        else:
-            self._node_configurations[label] = cloned_config
+        # all labels share the same configuration object, it is never mutated afterward
+        cloned_config = dict(config)
+        labels = label if isinstance(label, list) else [label]
+        # keep the cached binding resolvers if the configuration is unchanged, e.g. for the group node
+        # configurations that are added again on every show_cypher() call
+        if all(self._node_configurations.get(l) == cloned_config for l in labels):
+            return
+        self._node_configurations.update({l: cloned_config for l in labels})
+        self._mapping_cache.clear()
 
     # noinspection PyShadowingBuiltins
     def add_relationship_configuration(self, type: Union[str, list[str]], **kwargs: Dict[str, Any]) -> None:
@@ -579,12 +777,14 @@ class KuzuGraphWidget:
         if text_binding is not None:
             config["label"] = text_binding
 
-        cloned_config = {key: value for key, value in config.items()}
-        if isinstance(type, list):
-            for t in type:
-                self._edge_configurations[t] = cloned_config
-        else:
-            self._edge_configurations[type] = cloned_config
+        # all types share the same configuration object, it is never mutated afterward
+        cloned_config = dict(config)
+        types = type if isinstance(type, list) else [type]
+        # keep the cached binding resolvers if the configuration is unchanged
+        if all(self._edge_configurations.get(t) == cloned_config for t in types):
+            return
+        self._edge_configurations.update({t: cloned_config for t in types})
+        self._mapping_cache.clear()
 
     # noinspection PyShadowingBuiltins
     def add_parent_relationship_configuration(self, type: Union[str, list[str]], reverse: Optional[bool] = False) -> None:
@@ -621,6 +821,7 @@ class KuzuGraphWidget:
                 KuzuGraphWidget.__safe_delete_configuration(l, self._node_configurations)
         else:
             KuzuGraphWidget.__safe_delete_configuration(label, self._node_configurations)
+        self._mapping_cache.clear()
 
     # noinspection PyShadowingBuiltins
     def del_relationship_configuration(self, type: Union[str, list[str]]) -> None:
@@ -638,6 +839,7 @@ class KuzuGraphWidget:
                 KuzuGraphWidget.__safe_delete_configuration(t, self._edge_configurations)
         else:
             KuzuGraphWidget.__safe_delete_configuration(type, self._edge_configurations)
+        self._mapping_cache.clear()
 
     @staticmethod
     def __safe_delete_configuration(key: str, configurations: Dict[str, Any]) -> None:
@@ -685,42 +887,29 @@ class KuzuGraphWidget:
     @node_cell_mapping.deleter
     def node_cell_mapping(self) -> None:  # type: ignore[override]
         """Delete the node-to-cell mapping if present."""
-        if hasattr(self, '_node_cell_mapping'):
-            delattr(self, '_node_cell_mapping')
+        self.__dict__.pop('_node_cell_mapping', None)
 
-    # Backwards-compatible wrappers (deprecated)
+    # Backwards-compatible wrappers (deprecated). They are deliberately plain methods: resolving them in __getattr__
+    # hides them from hasattr(), super() and help(), and caching a partial on the instance creates a reference cycle,
+    # while the bound method allocation saved per call is negligible.
     def get_node_cell_mapping(self) -> Union[str, Callable, None]:
         """
         Deprecated: Use the 'node_cell_mapping' property instead.
         """
-        warnings.warn(
-            "get_node_cell_mapping() is deprecated. Use the 'node_cell_mapping' property instead.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        _warn_deprecated(_MSG_GET_NCM)
         return self.node_cell_mapping
 
     def set_node_cell_mapping(self, node_cell_mapping: Union[str, Callable]) -> None:
         """
         Deprecated: Use the 'node_cell_mapping' property instead.
         """
-        warnings.warn(
-            "set_node_cell_mapping() is deprecated. Use the 'node_cell_mapping' property instead.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        _warn_deprecated(_MSG_SET_NCM)
         self.node_cell_mapping = node_cell_mapping
 
     def del_node_cell_mapping(self) -> None:
         """
         Deprecated: Use the 'node_cell_mapping' property instead.
         """
-        warnings.warn(
-            "del_node_cell_mapping() is deprecated. Use the 'node_cell_mapping' property instead.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-        try:
-            del self.node_cell_mapping
-        except AttributeError:
-            pass
\ No newline at end of file
+        _warn_deprecated(_MSG_DEL_NCM)
+        # the property deleter does not raise if the mapping is not set
+        del self.node_cell_mapping
@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import textwrap
+import warnings
+
+import pytest
+
+pytest.importorskip("yfiles_jupyter_graphs")
+
+from yfiles_jupyter_graphs_for_kuzu import KuzuGraphWidget
+
+# calls every deprecated method in a fresh interpreter, i.e. with the stock warnings filters of Python
+DEPRECATED_CALLS = textwrap.dedent("""
+    import warnings
+
+    from yfiles_jupyter_graphs_for_kuzu import KuzuGraphWidget
+
+    # the default filters match the module by a plain string instead of a regular expression
+    assert ('default', None, DeprecationWarning, '__main__', 0) in warnings.filters
+
+    widget = KuzuGraphWidget()
+    widget.set_connection("connection")
+    assert widget.get_connection() == "connection"
+    widget.set_node_cell_mapping("cell")
+    assert widget.get_node_cell_mapping() == "cell"
+    widget.del_node_cell_mapping()
+    assert widget.node_cell_mapping is None
+""")
+
+
+@pytest.mark.parametrize("disable_stacklevel", ["", "1"])
+def test_deprecated_methods_with_default_filters(disable_stacklevel):
+    env = {key: value for key, value in os.environ.items() if key not in ("PYTHONWARNINGS", "PYTHONDEVMODE")}
+    env["YFILES_KUZU_DISABLE_WARN_STACKLEVEL"] = disable_stacklevel
+    result = subprocess.run([sys.executable, "-c", DEPRECATED_CALLS], env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    # the warnings are only shown if they are attributed to __main__
+    shown = result.stderr.count("DeprecationWarning")
+    assert shown == (0 if disable_stacklevel else 5), result.stderr
+
+
+def test_default_action_warns_once_per_location():
+    widget = KuzuGraphWidget()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.resetwarnings()
+        warnings.simplefilter("default")
+        for _ in range(2):
+            widget.get_connection()
+        widget.get_connection()
+    assert [warning.category for warning in caught] == [DeprecationWarning, DeprecationWarning]
+
+
+def test_once_action_warns_once():
+    widget = KuzuGraphWidget()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.resetwarnings()
+        warnings.simplefilter("once")
+        widget.get_connection()
+        widget.get_connection()
+    assert [warning.category for warning in caught] == [DeprecationWarning]